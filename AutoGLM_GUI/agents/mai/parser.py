@@ -13,6 +13,10 @@ from typing import Any
 
 SCALE_FACTOR = 999
 
+_TOOL_CALL_PATTERN = re.compile(
+    r"<thinking>(.*?)</thinking>.*?<tool_call>(.*?)</tool_call>", re.DOTALL
+)
+
 
 class MAIParseError(ValueError):
     pass
@@ -40,8 +44,7 @@ class MAIParser:
             text = text.replace("</think>", "</thinking>")
             text = "<thinking>" + text
 
-        pattern = r"<thinking>(.*?)</thinking>.*?<tool_call>(.*?)</tool_call>"
-        match = re.search(pattern, text, re.DOTALL)
+        match = _TOOL_CALL_PATTERN.search(text)
 
         if not match:
             raise MAIParseError("Failed to find <thinking> and <tool_call> tags")
@@ -101,8 +104,7 @@ class MAIParser:
             text = text.replace("</think>", "</thinking>")
             text = "<thinking>" + text
 
-        pattern = r"<thinking>(.*?)</thinking>.*?<tool_call>(.*?)</tool_call>"
-        match = re.search(pattern, text, re.DOTALL)
+        match = _TOOL_CALL_PATTERN.search(text)
 
         if not match:
             raise ValueError("Failed to find <thinking> and <tool_call> tags")
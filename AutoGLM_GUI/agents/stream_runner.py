@@ -2,13 +2,20 @@ import queue
 import threading
 import typing
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from fastapi.concurrency import run_in_threadpool
 
 from AutoGLM_GUI.agents.events import AgentEvent, AgentEventType
 
 if typing.TYPE_CHECKING:
     from AutoGLM_GUI.agents.protocols import BaseAgent
 
+# 合并 thinking 片段时单个事件的最大字符数
+MAX_COALESCED_THINKING_CHARS = 4096
+
+_NO_PENDING: Any = object()
+
 
 class AgentStepStreamer:
     """
@@ -32,6 +39,8 @@ class AgentStepStreamer:
         )
         self._stop_event = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
+        # 合并 thinking 片段时多取出的一项（事件元组或结束标记 None）
+        self._pending_item: Any = _NO_PENDING
 
     def __iter__(self) -> Iterator[AgentEvent]:
         """返回迭代器."""
@@ -73,6 +82,64 @@ class AgentStepStreamer:
             self._stop_event.set()
             return AgentEvent(type=AgentEventType.ERROR.value, data={"message": str(e)})
 
+    def _next_or_none(self) -> Optional[AgentEvent]:
+        """获取下一个事件，迭代结束时返回 None（StopIteration 无法穿过 Future）.
+
+        队列中已积压的连续 thinking 片段会合并为一个事件，减少下游的帧数。
+        """
+        if self._pending_item is not _NO_PENDING:
+            item, self._pending_item = self._pending_item, _NO_PENDING
+            if item is None:
+                return None
+            event_type, event_data = item
+            return AgentEvent(type=event_type, data=event_data)
+
+        try:
+            event = next(self)
+        except StopIteration:
+            return None
+
+        if event["type"] == AgentEventType.THINKING.value:
+            return self._coalesce_thinking(event)
+        return event
+
+    def _coalesce_thinking(self, event: AgentEvent) -> AgentEvent:
+        """非阻塞地合并队列中紧随其后的 thinking 片段."""
+        chunks = [event["data"]["chunk"]]
+        size = len(chunks[0])
+
+        while size < MAX_COALESCED_THINKING_CHARS:
+            try:
+                item = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None or item[0] != AgentEventType.THINKING.value:
+                self._pending_item = item
+                break
+
+            chunk = item[1]["chunk"]
+            chunks.append(chunk)
+            size += len(chunk)
+
+        if len(chunks) == 1:
+            return event
+        return AgentEvent(
+            type=AgentEventType.THINKING.value, data={"chunk": "".join(chunks)}
+        )
+
+    async def aiter(self) -> AsyncIterator[AgentEvent]:
+        """异步迭代事件，阻塞的队列读取在线程中执行，不占用事件循环.
+
+        使用 Starlette/anyio 线程池（与其余流式调用共用同一限流器），
+        避免每个活跃流长期占用 asyncio 默认线程池的一个线程。
+        """
+        while True:
+            event = await run_in_threadpool(self._next_or_none)
+            if event is None:
+                return
+            yield event
+
     def _start_worker(self) -> None:
         """启动 worker 线程."""
 
@@ -169,17 +236,21 @@ class AgentStepStreamer:
         try:
             yield self.abort
         finally:
-            self._stop_event.set()
-            # 等待 worker 完成
-            if self._worker_thread and self._worker_thread.is_alive():
-                self._worker_thread.join(timeout=5.0)
+            self.close()
 
-            # 清空队列
-            while not self._event_queue.empty():
-                try:
-                    self._event_queue.get_nowait()
-                except queue.Empty:
-                    break
+    def close(self) -> None:
+        """停止 worker 并清空队列（会阻塞等待 worker，异步代码中需放到线程执行）."""
+        self._stop_event.set()
+        # 等待 worker 完成
+        if self._worker_thread and self._worker_thread.is_alive():
+            self._worker_thread.join(timeout=5.0)
+
+        # 清空队列
+        while not self._event_queue.empty():
+            try:
+                self._event_queue.get_nowait()
+            except queue.Empty:
+                break
 
     def abort(self) -> None:
         """中止流式执行."""
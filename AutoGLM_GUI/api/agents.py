@@ -1,14 +1,29 @@
 """Agent lifecycle and chat routes."""
 
-import json
-
-from fastapi import APIRouter, HTTPException
+import asyncio
+import hashlib
+import time
+from functools import lru_cache
+from typing import cast
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from AutoGLM_GUI.agents.events import AgentEventType
+from AutoGLM_GUI.agents.protocols import BaseAgent
+from AutoGLM_GUI.agents.stream_runner import AgentStepStreamer
 from AutoGLM_GUI.config import AgentConfig, ModelConfig
+from AutoGLM_GUI.config_manager import ConfigModel, config_manager
+from AutoGLM_GUI.exceptions import (
+    AgentInitializationError,
+    AgentNotInitializedError,
+    DeviceBusyError,
+)
 from AutoGLM_GUI.logger import logger
+from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
 from AutoGLM_GUI.schemas import (
     AbortRequest,
     ChatRequest,
@@ -22,11 +37,18 @@ from AutoGLM_GUI.schemas import (
 from AutoGLM_GUI.state import (
     non_blocking_takeover,
 )
+from AutoGLM_GUI.types import AgentSpecificConfig
 from AutoGLM_GUI.version import APP_VERSION
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _manager() -> PhoneAgentManager:
+    """PhoneAgentManager singleton, looked up once instead of per request."""
+    return PhoneAgentManager.get_instance()
+
+
 def _setup_adb_keyboard(device_id: str) -> None:
     """检查并自动安装 ADB Keyboard。
 
@@ -52,13 +74,48 @@ def _setup_adb_keyboard(device_id: str) -> None:
 
 SSEPayload = dict[str, str | int | bool | None | dict]
 
+# 空闲时发送 SSE 注释帧的间隔（秒），避免 nginx/CDN 在长步骤中断开连接
+_SSE_KEEPALIVE_INTERVAL = 15.0
+_SSE_KEEPALIVE_FRAME = b": ping\n\n"
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+_STEP_EVENT = AgentEventType.STEP.value
+
+_SSE_PREFIX: dict[str, bytes] = {
+    t.value: f"event: {t.value}\ndata: ".encode() for t in AgentEventType
+}
 
-def _create_sse_event(
-    event_type: str, data: SSEPayload, role: str = "assistant"
-) -> SSEPayload:
-    """Create an SSE event with standardized fields including role."""
-    event_data = {"type": event_type, "role": role, **data}
-    return event_data
+
+def _sse_frame(event_type: str, data: SSEPayload, role: str = "assistant") -> bytes:
+    """Encode an SSE frame with standardized fields (type, role) in one pass."""
+    prefix = _SSE_PREFIX.get(event_type)
+    if prefix is None:
+        prefix = f"event: {event_type}\ndata: ".encode()
+    payload = orjson.dumps(
+        {"type": event_type, "role": role, **data}, option=orjson.OPT_NON_STR_KEYS
+    )
+    return prefix + payload + b"\n\n"
+
+
+def _config_etag(config_response: ConfigResponse) -> str:
+    """根据配置响应内容计算强 ETag."""
+    payload = orjson.dumps(config_response.model_dump())
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """判断 If-None-Match 请求头是否命中当前 ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
 
 
 @router.post("/api/init", deprecated=True)
@@ -74,8 +131,6 @@ def init_agent(request: InitRequest) -> dict:
     配置完全由 ConfigManager 提供（CLI > ENV > FILE > DEFAULT），
     不接受运行时覆盖。
     """
-    from AutoGLM_GUI.config_manager import config_manager
-
     device_id = request.device_id
     if not device_id:
         raise HTTPException(status_code=400, detail="device_id is required")
@@ -113,15 +168,9 @@ def init_agent(request: InitRequest) -> dict:
         _setup_adb_keyboard(device_id)
 
         # Use agent factory to create agent
-        from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
-        manager = PhoneAgentManager.get_instance()
+        manager = _manager()
 
         # Initialize agent using factory pattern
-        from typing import cast
-
-        from AutoGLM_GUI.types import AgentSpecificConfig
-
         agent_config_params = cast(
             AgentSpecificConfig, request.agent_config_params or {}
         )
@@ -159,11 +208,8 @@ def chat(request: ChatRequest) -> ChatResponse:
 
     Agent 会在首次使用时自动初始化，无需手动调用 /api/init。
     """
-    from AutoGLM_GUI.exceptions import AgentInitializationError, DeviceBusyError
-    from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
     device_id = request.device_id
-    manager = PhoneAgentManager.get_instance()
+    manager = _manager()
 
     # use_agent 默认 auto_initialize=True，会自动初始化 Agent
     try:
@@ -188,94 +234,131 @@ def chat(request: ChatRequest) -> ChatResponse:
         return ChatResponse(result=str(e), steps=0, success=False)
 
 
+def _acquire_agent(manager: PhoneAgentManager, device_id: str) -> BaseAgent:
+    """Acquire the device (auto-initializing its agent) and return the agent.
+
+    Blocking: initialization and the manager lock can take a while, so this
+    runs in a worker thread. The device is released again if the agent
+    lookup fails after the acquire.
+    """
+    manager.acquire_device(
+        device_id, timeout=0, raise_on_timeout=True, auto_initialize=True
+    )
+    try:
+        return manager.get_agent(device_id)
+    except BaseException:
+        manager.release_device(device_id)
+        raise
+
+
+async def _acquire_agent_async(manager: PhoneAgentManager, device_id: str) -> BaseAgent:
+    """Run _acquire_agent off-loop without leaking the device on cancellation.
+
+    If the client disconnects while the acquire is pending, the worker thread
+    still completes it; the device is then released as soon as it does.
+    """
+    task = asyncio.ensure_future(run_in_threadpool(_acquire_agent, manager, device_id))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+
+        def _release_if_acquired(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.exception() is None:
+                asyncio.ensure_future(
+                    run_in_threadpool(manager.release_device, device_id)
+                )
+
+        task.add_done_callback(_release_if_acquired)
+        raise
+
+
+def _close_stream(
+    manager: PhoneAgentManager,
+    device_id: str,
+    streamer: AgentStepStreamer,
+) -> None:
+    """Stop the stream worker, then release the device (blocking, run off-loop).
+
+    Both steps run in one worker call so the device is only released after
+    the agent thread has stopped.
+    """
+    try:
+        streamer.close()
+    finally:
+        manager.release_device(device_id)
+
+
 @router.post("/api/chat/stream")
-def chat_stream(request: ChatRequest):
+async def chat_stream(request: ChatRequest):
     """发送任务给 Agent 并实时推送执行进度（SSE，多设备支持）。
 
     Agent 会在首次使用时自动初始化，无需手动调用 /api/init。
     """
-    from AutoGLM_GUI.agents.stream_runner import AgentStepStreamer
-    from AutoGLM_GUI.exceptions import AgentInitializationError, DeviceBusyError
-    from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
     device_id = request.device_id
-    manager = PhoneAgentManager.get_instance()
+    manager = _manager()
 
-    def event_generator():
-        acquired = False
+    async def event_generator():
         try:
-            # 使用 auto_initialize=True 自动初始化 Agent
-            acquired = manager.acquire_device(
-                device_id, timeout=0, raise_on_timeout=True, auto_initialize=True
-            )
-
+            # 使用 auto_initialize=True 自动初始化 Agent（初始化可能阻塞，放到线程中执行）
+            agent = await _acquire_agent_async(manager, device_id)
+            streamer = AgentStepStreamer(agent=agent, task=request.message)
             try:
-                agent = manager.get_agent(device_id)
-                streamer = AgentStepStreamer(agent=agent, task=request.message)
-
-                with streamer.stream_context() as abort_fn:
-                    manager.register_abort_handler(device_id, abort_fn)
+                manager.register_abort_handler(device_id, streamer.abort)
+                last_sent = time.monotonic()
 
-                    for event in streamer:
-                        event_type = event["type"]
-                        event_data_dict = event["data"]
+                async for event in streamer.aiter():
+                    event_type, event_data_dict = event["type"], event["data"]
 
-                        if (
-                            event_type == AgentEventType.STEP.value
-                            and event_data_dict.get("step") == -1
-                        ):
-                            continue
+                    if event_type == _STEP_EVENT and event_data_dict["step"] == -1:
+                        # 空闲心跳：定期发送注释帧保持连接
+                        now = time.monotonic()
+                        if now - last_sent >= _SSE_KEEPALIVE_INTERVAL:
+                            last_sent = now
+                            yield _SSE_KEEPALIVE_FRAME
+                        continue
 
-                        event_data = _create_sse_event(event_type, event_data_dict)
-
-                        yield f"event: {event_type}\n"
-                        yield f"data: {json.dumps(event_data, ensure_ascii=False)}\n\n"
+                    yield _sse_frame(event_type, event_data_dict)
+                    last_sent = time.monotonic()
+                    # 让出事件循环，确保每帧 SSE 立即发送
+                    await asyncio.sleep(0)
 
             finally:
-                if acquired:
-                    manager.release_device(device_id)
+                # 独立任务 + shield：客户端断开（任务已被取消）时清理仍会执行
+                await asyncio.shield(
+                    asyncio.ensure_future(
+                        run_in_threadpool(_close_stream, manager, device_id, streamer)
+                    )
+                )
 
         except AgentInitializationError as e:
             # 初始化失败
             logger.error(f"Failed to initialize agent for {device_id}: {e}")
-            error_data = _create_sse_event(
+            yield _sse_frame(
                 "error",
                 {
                     "message": f"初始化失败: {str(e)}",
                     "hint": "请检查全局配置 (base_url, api_key, model_name)",
                 },
             )
-            yield "event: error\n"
-            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
         except DeviceBusyError:
-            error_data = _create_sse_event("error", {"message": "Device is busy"})
-            yield "event: error\n"
-            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+            yield _sse_frame("error", {"message": "Device is busy"})
         except Exception as e:
             logger.exception(f"Error in streaming chat for {device_id}")
-            error_data = _create_sse_event("error", {"message": str(e)})
-            yield "event: error\n"
-            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+            yield _sse_frame("error", {"message": str(e)})
         finally:
             manager.unregister_abort_handler(device_id)
 
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=_SSE_HEADERS,
     )
 
 
 @router.get("/api/status", response_model=StatusResponse)
 def get_status(device_id: str | None = None) -> StatusResponse:
     """获取 Agent 状态和版本信息（多设备支持）。"""
-    from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
-    manager = PhoneAgentManager.get_instance()
+    manager = _manager()
 
     if device_id is None:
         return StatusResponse(
@@ -302,11 +385,8 @@ def get_status(device_id: str | None = None) -> StatusResponse:
 @router.post("/api/reset")
 def reset_agent(request: ResetRequest) -> dict:
     """重置 Agent 状态（多设备支持）。"""
-    from AutoGLM_GUI.exceptions import AgentNotInitializedError
-    from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
     device_id = request.device_id
-    manager = PhoneAgentManager.get_instance()
+    manager = _manager()
 
     try:
         manager.reset_agent(device_id)
@@ -322,10 +402,8 @@ def reset_agent(request: ResetRequest) -> dict:
 @router.post("/api/chat/abort")
 def abort_chat(request: AbortRequest) -> dict:
     """中断正在进行的对话流。"""
-    from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
     device_id = request.device_id
-    manager = PhoneAgentManager.get_instance()
+    manager = _manager()
 
     success = manager.abort_streaming_chat(device_id)
 
@@ -336,21 +414,24 @@ def abort_chat(request: AbortRequest) -> dict:
 
 
 @router.get("/api/config", response_model=ConfigResponse)
-def get_config_endpoint() -> ConfigResponse:
-    """获取当前有效配置."""
-    from AutoGLM_GUI.config_manager import config_manager
+def get_config_endpoint(
+    request: Request, response: Response
+) -> Response | ConfigResponse:
+    """获取当前有效配置.
 
-    # 热重载：检查文件是否被外部修改
+    响应带 ETag；前端轮询时配置未变化则直接返回 304。
+    """
+    # 热重载：检查文件是否被外部修改（mtime 未变时不会重新解析）
     config_manager.load_file_config()
 
     # 获取有效配置和来源
     effective_config = config_manager.get_effective_config()
     source = config_manager.get_config_source()
 
-    # 检测冲突
+    # 检测冲突（按有效配置缓存）
     conflicts = config_manager.detect_conflicts()
 
-    return ConfigResponse(
+    config_response = ConfigResponse(
         base_url=effective_config.base_url,
         model_name=effective_config.model_name,
         api_key=effective_config.api_key if effective_config.api_key != "EMPTY" else "",
@@ -374,6 +455,13 @@ def get_config_endpoint() -> ConfigResponse:
         else None,
     )
 
+    etag = _config_etag(config_response)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return config_response
+
 
 @router.post("/api/config")
 def save_config_endpoint(request: ConfigSaveRequest) -> dict:
@@ -382,9 +470,6 @@ def save_config_endpoint(request: ConfigSaveRequest) -> dict:
     副作用：保存配置后会自动销毁所有已初始化的 Agent，
     确保下次使用时所有 Agent 都使用新配置。
     """
-    from AutoGLM_GUI.config_manager import ConfigModel, config_manager
-    from AutoGLM_GUI.phone_agent_manager import PhoneAgentManager
-
     try:
         # Validate incoming configuration
         ConfigModel(
@@ -414,7 +499,7 @@ def save_config_endpoint(request: ConfigSaveRequest) -> dict:
         config_manager.sync_to_env()
 
         # 副作用：销毁所有已初始化的 Agent，确保下次使用新配置
-        manager = PhoneAgentManager.get_instance()
+        manager = _manager()
         destroyed_agents = manager.list_agents()  # 获取需要销毁的 agent 列表
 
         for device_id in destroyed_agents:
@@ -460,8 +545,6 @@ def save_config_endpoint(request: ConfigSaveRequest) -> dict:
 @router.delete("/api/config")
 def delete_config_endpoint() -> dict:
     """删除配置文件."""
-    from AutoGLM_GUI.config_manager import config_manager
-
     try:
         success = config_manager.delete_file_config()
 
@@ -233,11 +233,16 @@ class UnifiedConfigManager:
 
         # 文件缓存（带修改时间戳）
         self._file_cache: Optional[dict] = None
-        self._file_mtime: Optional[float] = None
+        self._file_mtime_ns: Optional[int] = None
 
         # 有效配置缓存
         self._effective_config: Optional[ConfigModel] = None
 
+        # 冲突检测缓存（绑定到计算时的有效配置对象）
+        self._conflicts_cache: Optional[
+            tuple[Optional[ConfigModel], list[ConfigConflict]]
+        ] = None
+
         self._initialized = True
         logger.debug("UnifiedConfigManager initialized")
 
@@ -304,8 +309,9 @@ class UnifiedConfigManager:
         从文件加载配置，支持热重载.
 
         基于文件修改时间（mtime）的缓存机制：
-        - 如果文件未变化且有缓存，直接使用缓存
+        - 每次调用只做一次 stat，文件未变化且有缓存时直接使用缓存
         - 否则重新读取文件
+        - 文件不存在或读取失败时清空文件层（与之前语义一致）
 
         Args:
             force_reload: 强制重新加载，即使文件未变化
@@ -313,23 +319,26 @@ class UnifiedConfigManager:
         Returns:
             bool: 如果配置被加载/重载返回 True，否则返回 False
         """
-        if not self._config_path.exists():
+        try:
+            # 获取文件修改时间（纳秒精度，避免浮点 mtime 丢失同一秒内的写入）
+            current_mtime_ns = self._config_path.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            # 与 Path.exists() 一致：父路径不是目录时也视为文件不存在
             logger.debug(f"Config file not found: {self._config_path}")
+            if self._file_mtime_ns is None and self._file_cache is None:
+                return False  # 已经是"无文件"状态，无需再次失效缓存
             self._file_layer = ConfigLayer(source=ConfigSource.FILE)
             self._file_cache = None
-            self._file_mtime = None
+            self._file_mtime_ns = None
             self._effective_config = None
             return False
 
         try:
-            # 获取文件修改时间
-            current_mtime = self._config_path.stat().st_mtime
-
             # 使用缓存（如果文件未变化）
             if (
                 not force_reload
-                and self._file_mtime == current_mtime
-                and self._file_cache
+                and self._file_mtime_ns == current_mtime_ns
+                and self._file_cache is not None
             ):
                 logger.debug("Using cached config file (file unchanged)")
                 return False
@@ -340,7 +349,7 @@ class UnifiedConfigManager:
 
             # 更新缓存
             self._file_cache = config_data
-            self._file_mtime = current_mtime
+            self._file_mtime_ns = current_mtime_ns
 
             # 更新文件层
             self._file_layer = ConfigLayer(
@@ -366,14 +375,14 @@ class UnifiedConfigManager:
             logger.warning(f"Failed to parse config file: {e}")
             self._file_layer = ConfigLayer(source=ConfigSource.FILE)
             self._file_cache = None
-            self._file_mtime = None
+            self._file_mtime_ns = None
             self._effective_config = None
             return False
         except Exception as e:
             logger.error(f"Failed to read config file: {e}")
             self._file_layer = ConfigLayer(source=ConfigSource.FILE)
             self._file_cache = None
-            self._file_mtime = None
+            self._file_mtime_ns = None
             self._effective_config = None
             return False
 
@@ -490,7 +499,7 @@ class UnifiedConfigManager:
         try:
             self._config_path.unlink()
             self._file_cache = None
-            self._file_mtime = None
+            self._file_mtime_ns = None
             self._file_layer = ConfigLayer(source=ConfigSource.FILE)
             self._effective_config = None
             logger.info(f"Configuration deleted: {self._config_path}")
@@ -620,10 +629,29 @@ class UnifiedConfigManager:
         1. 配置文件中有某个字段的值
         2. CLI 或 ENV 有该字段的不同值（覆盖）
 
+        任何配置层变化（包括文件 mtime 变化触发的重载）都会清空
+        _effective_config，因此以有效配置对象本身作为缓存键，
+        轮询时可跳过重复检测。
+
         Returns:
             list[ConfigConflict]: 冲突列表
         """
-        conflicts = []
+        cache = self._conflicts_cache
+        if (
+            cache is not None
+            and self._effective_config is not None
+            and cache[0] is self._effective_config
+        ):
+            return list(cache[1])
+
+        conflicts = self._compute_conflicts()
+        self._conflicts_cache = (self._effective_config, conflicts)
+        # 返回副本，调用方修改列表不会污染缓存
+        return list(conflicts)
+
+    def _compute_conflicts(self) -> list[ConfigConflict]:
+        """逐字段比较文件层与 CLI/ENV 层，生成冲突列表."""
+        conflicts: list[ConfigConflict] = []
 
         if not self._file_layer.to_dict():
             return conflicts  # 无文件配置，无冲突
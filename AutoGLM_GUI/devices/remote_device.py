@@ -27,10 +27,27 @@ class RemoteDevice(DeviceProtocol):
         >>> device.tap(100, 200)
     """
 
-    def __init__(self, device_id: str, base_url: str, timeout: float = 30.0):
+    def __init__(
+        self,
+        device_id: str,
+        base_url: str,
+        timeout: float = 30.0,
+        client: httpx.Client | None = None,
+    ):
+        """
+        Initialize the remote device.
+
+        Args:
+            device_id: Device identifier on the Device Agent
+            base_url: Device Agent base URL
+            timeout: HTTP timeout (ignored when ``client`` is given)
+            client: Shared HTTP client to reuse its connection pool; the
+                caller keeps ownership and closes it
+        """
         self._device_id = device_id
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.Client(timeout=timeout)
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.Client(timeout=timeout)
 
     @property
     def device_id(self) -> str:
@@ -121,8 +138,9 @@ class RemoteDevice(DeviceProtocol):
         self._post("/restore_keyboard", {"ime": ime})
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client (unless it was injected)."""
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self):
         return self
@@ -151,8 +169,9 @@ class RemoteDeviceManager(DeviceManagerProtocol):
 
     def get_device(self, device_id: str) -> RemoteDevice:
         if device_id not in self._devices:
+            # Devices share the manager's connection pool
             self._devices[device_id] = RemoteDevice(
-                device_id, self._base_url, self._timeout
+                device_id, self._base_url, self._timeout, client=self._client
             )
         return self._devices[device_id]
 
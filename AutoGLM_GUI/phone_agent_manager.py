@@ -5,7 +5,7 @@ from __future__ import annotations
 import threading
 import time
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Optional
 
@@ -50,6 +50,17 @@ class StreamingAgentContext:
     stop_event: threading.Event
 
 
+@dataclass
+class _DeviceGate:
+    """Per-device admission gate: holder counter guarded by a condition.
+
+    Agents are not thread-safe, so a device admits a single holder at a time.
+    """
+
+    holders: int = 0
+    cond: threading.Condition = field(default_factory=threading.Condition)
+
+
 class PhoneAgentManager:
     """
     Singleton manager for agent lifecycle and concurrency control.
@@ -84,9 +95,9 @@ class PhoneAgentManager:
         # Manager-level lock (protects internal state)
         self._manager_lock = threading.RLock()
 
-        # Device-level locks (per-device concurrency control)
-        self._device_locks: dict[str, threading.Lock] = {}
-        self._device_locks_lock = threading.Lock()
+        # Device-level gates (per-device concurrency control)
+        self._device_gates: dict[str, _DeviceGate] = {}
+        self._device_gates_lock = threading.Lock()
 
         # Agent metadata (indexed by device_id)
         # State is stored in AgentMetadata.state (single source of truth)
@@ -132,8 +143,10 @@ class PhoneAgentManager:
                 logger.debug(f"Agent already initialized for {device_id}")
                 return self._agents[device_id]
 
-            device_lock = self._get_device_lock(device_id)
-            if device_lock.locked():
+            gate = self._get_device_gate(device_id)
+            with gate.cond:
+                busy = gate.holders > 0
+            if busy:
                 raise DeviceBusyError(
                     f"Device {device_id} is currently processing a request"
                 )
@@ -312,26 +325,26 @@ class PhoneAgentManager:
 
     # ==================== Concurrency Control ====================
 
-    def _get_device_lock(self, device_id: str) -> threading.Lock:
+    def _get_device_gate(self, device_id: str) -> _DeviceGate:
         """
-        Get or create device lock (double-checked locking pattern).
+        Get or create device gate (double-checked locking pattern).
 
         Args:
             device_id: Device identifier
 
         Returns:
-            threading.Lock: Device-specific lock
+            _DeviceGate: Device-specific gate
         """
-        # Fast path: lock already exists
-        if device_id in self._device_locks:
-            return self._device_locks[device_id]
+        # Fast path: gate already exists
+        if device_id in self._device_gates:
+            return self._device_gates[device_id]
 
-        # Slow path: create lock
-        with self._device_locks_lock:
+        # Slow path: create gate
+        with self._device_gates_lock:
             # Double-check inside lock
-            if device_id not in self._device_locks:
-                self._device_locks[device_id] = threading.Lock()
-            return self._device_locks[device_id]
+            if device_id not in self._device_gates:
+                self._device_gates[device_id] = _DeviceGate()
+            return self._device_gates[device_id]
 
     def acquire_device(
         self,
@@ -370,18 +383,21 @@ class PhoneAgentManager:
                     f"Use auto_initialize=True or call initialize_agent() first."
                 )
 
-        lock = self._get_device_lock(device_id)
+        gate = self._get_device_gate(device_id)
 
         # Try to acquire with timeout
-        if timeout is None:
-            # Blocking mode
-            acquired = lock.acquire(blocking=True)
-        elif timeout == 0:
-            # Non-blocking mode
-            acquired = lock.acquire(blocking=False)
-        else:
-            # Timeout mode
-            acquired = lock.acquire(blocking=True, timeout=timeout)
+        with gate.cond:
+            if timeout is None:
+                # Blocking mode
+                gate.cond.wait_for(lambda: gate.holders == 0)
+                acquired = True
+            else:
+                # Non-blocking (timeout == 0) or timeout mode
+                acquired = gate.cond.wait_for(
+                    lambda: gate.holders == 0, timeout=timeout
+                )
+            if acquired:
+                gate.holders += 1
 
         if acquired:
             # Update state
@@ -402,19 +418,24 @@ class PhoneAgentManager:
 
     def release_device(self, device_id: str) -> None:
         """
-        Release device lock.
+        Release device lock and wake one waiter.
 
         Args:
             device_id: Device identifier
         """
-        lock = self._get_device_lock(device_id)
-
-        if lock.locked():
-            lock.release()
-
-            # Update state
-            with self._manager_lock:
-                if device_id in self._metadata:
+        gate = self._get_device_gate(device_id)
+
+        with gate.cond:
+            if gate.holders == 0:
+                return
+            gate.holders -= 1
+            gate.cond.notify(1)
+            idle = gate.holders == 0
+
+        if idle:
+            # Update state（重新检查：被唤醒的等待者可能已再次持有设备）
+            with self._manager_lock, gate.cond:
+                if gate.holders == 0 and device_id in self._metadata:
                     self._metadata[device_id].state = AgentState.IDLE
 
             logger.debug(f"Device lock released for {device_id}")
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import random
 import socket
 import subprocess
 import sys
@@ -24,6 +25,13 @@ from AutoGLM_GUI.scrcpy_protocol import (
 )
 
 
+def _retry_backoff(
+    attempt: int, base: float = 0.25, cap: float = 4.0, jitter: float = 0.25
+) -> float:
+    """Exponential backoff with jitter (avoids synchronized retries across clients)."""
+    return min(cap, base * 2**attempt + random.uniform(0, jitter))
+
+
 async def is_port_available(port: int, host: str = "127.0.0.1") -> bool:
     """Test if TCP port is available for binding.
 
@@ -307,7 +315,6 @@ class ScrcpyStreamer:
     async def _start_server(self) -> None:
         """Start scrcpy server on device with intelligent retry."""
         max_retries = 3
-        retry_delay = 1.0  # Reduced from 2s (cleanup handles waiting now)
 
         options = self._build_server_options()
 
@@ -366,8 +373,9 @@ class ScrcpyStreamer:
                         f"Error: {error_msg[:200]}"
                     )
                     if attempt < max_retries - 1:
+                        retry_delay = _retry_backoff(attempt)
                         logger.warning(
-                            f"Retrying with aggressive cleanup in {retry_delay}s..."
+                            f"Retrying with aggressive cleanup in {retry_delay:.2f}s..."
                         )
                         await self._cleanup_existing_server()
                         await asyncio.sleep(retry_delay)
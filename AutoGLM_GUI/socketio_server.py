@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import time
+from typing import Any
 
-from typing_extensions import NotRequired, TypedDict
-
+import orjson
 import socketio
+from typing_extensions import NotRequired, TypedDict
 
 from AutoGLM_GUI.logger import logger
 from AutoGLM_GUI.scrcpy_protocol import ScrcpyMediaStreamPacket
@@ -22,12 +23,34 @@ class VideoPacketPayload(TypedDict):
     pts: NotRequired[int | None]
 
 
+class _OrjsonJSON:
+    """json-module shim backed by orjson for python-socketio/engineio.
+
+    socketio strips bytes into binary attachments before encoding, so only the
+    small metadata wrapper goes through here; callers pass stdlib kwargs such as
+    ``separators`` which orjson's compact output already satisfies.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, *args: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s: str | bytes, *args: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins="*",
+    json=_OrjsonJSON,
     server_kwargs={"socketio_path": "/socket.io"},
 )
 
+# Max engine.io packets queued for a client before video frames are dropped.
+# Each video-data event with a binary attachment queues two packets.
+_VIDEO_BACKLOG_LIMIT = 32
+
 _socket_streamers: dict[str, ScrcpyStreamer] = {}
 _stream_tasks: dict[str, asyncio.Task] = {}
 _device_locks: dict[
@@ -101,9 +124,42 @@ def stop_streamers(device_id: str | None = None) -> None:
         _socket_streamers.pop(sid, None)
 
 
+def _client_backlog(sid: str) -> int:
+    """Number of engine.io packets queued for ``sid`` but not yet written.
+
+    ``sio.emit`` never waits on the client: engine.io puts packets on an
+    unbounded per-socket queue that its writer drains at the client's pace,
+    so the depth of that queue is where a slow client shows up.
+    """
+    eio_sid = sio.manager.eio_sid_from_sid(sid, "/")
+    socket = sio.eio.sockets.get(eio_sid) if eio_sid else None
+    return socket.queue.qsize() if socket is not None else 0
+
+
 async def _stream_packets(sid: str, streamer: ScrcpyStreamer) -> None:
+    """Forward scrcpy packets to the client, shedding frames while it lags.
+
+    When the client's engine.io backlog reaches ``_VIDEO_BACKLOG_LIMIT``,
+    video frames are dropped (config packets always pass) and forwarding
+    resumes at the next keyframe once the backlog has drained, so the
+    decoder never sees a broken GOP.
+    """
+    waiting_for_keyframe = False
+    dropped = 0
     try:
         async for packet in streamer.iter_packets():
+            if packet.type == "data":
+                if _client_backlog(sid) >= _VIDEO_BACKLOG_LIMIT:
+                    waiting_for_keyframe = True
+                    dropped += 1
+                    continue
+                if waiting_for_keyframe:
+                    if not packet.keyframe:
+                        dropped += 1
+                        continue
+                    logger.debug(f"Video client lagging, dropped {dropped} frames")
+                    waiting_for_keyframe = False
+                    dropped = 0
             payload = _packet_to_payload(packet)
             await sio.emit("video-data", payload, to=sid)
     except asyncio.CancelledError:
@@ -119,6 +175,11 @@ async def _stream_packets(sid: str, streamer: ScrcpyStreamer) -> None:
 
 
 def _packet_to_payload(packet: ScrcpyMediaStreamPacket) -> VideoPacketPayload:
+    """Build the video-data payload.
+
+    ``data`` stays raw bytes: python-socketio sends it as a binary attachment
+    (no base64), and the client receives it as an ArrayBuffer.
+    """
     payload: VideoPacketPayload = {
         "type": packet.type,
         "data": packet.data,
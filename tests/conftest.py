@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from AutoGLM_GUI.parsers import MAIParser
+
+
+@pytest.fixture(scope="session")
+def mai_parser():
+    """Stateless MAI parser shared across test modules."""
+    return MAIParser()
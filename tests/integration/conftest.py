@@ -1,42 +1,64 @@
 """Pytest fixtures for integration tests."""
 
+import asyncio
 import multiprocessing
 import socket
 import time
-from contextlib import closing
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
 from pathlib import Path
 
 import httpx
 import pytest
 
 
-def find_free_port(start: int = 18000, end: int = 19000) -> int:
-    """Find a free port in the specified range.
+def _get_mp_context() -> multiprocessing.context.BaseContext:
+    """Multiprocessing context for the mock server subprocesses.
 
-    Args:
-        start: Start of port range
-        end: End of port range (inclusive)
+    Uses a forkserver with the server modules preloaded, so each child only
+    pays fork cost instead of re-importing FastAPI/uvicorn. Platforms without
+    forkserver (Windows) fall back to spawn.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(
+        [
+            "uvicorn",
+            "tests.integration.device_agent.mock_llm_server",
+            "tests.integration.device_agent.mock_agent_server",
+        ]
+    )
+    return ctx
 
-    Returns:
-        A free port number
 
-    Raises:
-        RuntimeError: If no free port is found
+_mp_context = _get_mp_context()
+
+
+def bind_free_socket() -> socket.socket:
+    """Bind a socket on a kernel-assigned free port.
+
+    The socket is handed to the server subprocess, which serves on it
+    directly, so the port can't be taken by someone else in between.
+
+    Returns:
+        A bound (not yet listening) TCP socket
     """
-    for port in range(start, end + 1):
-        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
-            try:
-                sock.bind(("127.0.0.1", port))
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                return port
-            except OSError:
-                continue
-    raise RuntimeError(f"No free port found in range {start}-{end}")
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    return sock
 
 
-def wait_for_server(url: str, timeout: float = 5.0, endpoint: str = "/test/stats"):
+async def wait_for_server_async(
+    url: str, timeout: float = 5.0, endpoint: str = "/test/stats"
+) -> None:
     """Wait for server to become ready.
 
+    Polls with exponential backoff (25ms, capped at 200ms) so a fast server
+    is picked up almost immediately.
+
     Args:
         url: Base URL of the server
         timeout: Maximum wait time in seconds
@@ -45,18 +67,41 @@ def wait_for_server(url: str, timeout: float = 5.0, endpoint: str = "/test/stats
     Raises:
         RuntimeError: If server doesn't become ready within timeout
     """
+    delay = 0.025
     start = time.time()
-    while time.time() - start < timeout:
-        try:
-            resp = httpx.get(f"{url}{endpoint}", timeout=1.0)
-            if resp.status_code == 200:
-                return
-        except Exception:
-            pass
-        time.sleep(0.1)
+    async with httpx.AsyncClient(timeout=1.0) as client:
+        while time.time() - start < timeout:
+            try:
+                resp = await client.get(f"{url}{endpoint}")
+                if resp.status_code == 200:
+                    return
+            except Exception:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
     raise RuntimeError(f"Server at {url} failed to start within {timeout}s")
 
 
+# Under pytest-xdist each worker gets its own session fixtures, i.e. its own
+# pair of mock servers. Grouping every test that needs them lets
+# ``pytest -n auto --dist loadgroup`` boot the servers on a single worker
+# while the remaining workers run the server-free tests.
+_MOCK_SERVERS_GROUP = "mock_servers"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Registered here so the marker is known even without pytest-xdist.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of a group on the same xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    for item in items:
+        if "mock_servers" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.xdist_group(_MOCK_SERVERS_GROUP))
+
+
 @pytest.fixture
 def scenarios_dir() -> Path:
     """Get the test scenarios directory."""
@@ -69,97 +114,138 @@ def sample_test_case(scenarios_dir: Path) -> Path:
     return scenarios_dir / "meituan_message" / "scenario.yaml"
 
 
-def _run_llm_server(port: int):
+def _run_llm_server(sock: socket.socket):
     """Run the mock LLM server in a subprocess."""
     from tests.integration.device_agent.mock_llm_server import run_server
 
-    run_server(port=port, log_level="warning")
+    run_server(log_level="warning", sock=sock)
 
 
-def _run_agent_server(port: int, scenario_path: str | None = None):
+def _run_agent_server(sock: socket.socket):
     """Run the mock agent server in a subprocess."""
     import uvicorn
 
     from tests.integration.device_agent.mock_agent_server import create_app
 
-    app = create_app(scenario_path=scenario_path)
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+    # 未预加载场景时 lifespan 为空操作，直接关闭
+    config = uvicorn.Config(
+        create_app(),
+        log_level="warning",
+        access_log=False,
+        lifespan="off",
+        ws="none",
+    )
+    uvicorn.Server(config).run(sockets=[sock])
 
 
-@pytest.fixture
-def mock_llm_server():
-    """Start mock LLM server on a free port (function-scoped).
+def _start_server_process(target, sock: socket.socket) -> BaseProcess:
+    """Start a daemon subprocess serving on sock, handing the socket over."""
+    proc = _mp_context.Process(target=target, args=(sock,), daemon=True)
+    proc.start()
+    # The child owns the listener now
+    sock.close()
+    return proc
+
+
+def _stop_process(proc: BaseProcess) -> None:
+    """Terminate a server subprocess, killing it if it doesn't exit."""
+    proc.terminate()
+    proc.join(timeout=2)
+    if proc.is_alive():
+        proc.kill()
+        proc.join(timeout=1)
+
+
+@dataclass(frozen=True)
+class MockServers:
+    """Base URLs of the mock LLM and mock agent servers."""
+
+    llm_url: str
+    agent_url: str
+
+
+@pytest.fixture(scope="session")
+def mock_servers():
+    """Start both mock servers once per session, waiting for them concurrently.
+
+    The servers are shared by every test; the function-scoped client
+    fixtures (``mock_llm_client``, ``test_client``) reset their state
+    through the ``/test/reset`` endpoints before each test.
+
+    Returns:
+        MockServers with the base URL of each server
+    """
+    llm_sock = bind_free_socket()
+    agent_sock = bind_free_socket()
+    servers = MockServers(
+        llm_url=f"http://127.0.0.1:{llm_sock.getsockname()[1]}",
+        agent_url=f"http://127.0.0.1:{agent_sock.getsockname()[1]}",
+    )
+    procs = [
+        _start_server_process(_run_llm_server, llm_sock),
+        _start_server_process(_run_agent_server, agent_sock),
+    ]
+
+    async def wait_all() -> None:
+        await asyncio.gather(
+            wait_for_server_async(servers.llm_url, endpoint="/test/stats"),
+            wait_for_server_async(servers.agent_url, endpoint="/test/commands"),
+        )
+
+    try:
+        asyncio.run(wait_all())
+        yield servers
+    finally:
+        for proc in procs:
+            _stop_process(proc)
+
+
+@pytest.fixture(scope="session")
+def mock_llm_server(mock_servers: MockServers) -> str:
+    """Base URL of the shared mock LLM server (session-scoped).
 
     Returns:
         Base URL of the mock LLM server (e.g., "http://127.0.0.1:18123")
 
     Example:
-        def test_something(mock_llm_server: str):
+        def test_something(mock_llm_server: str, mock_llm_client):
             model_config = ModelConfig(
                 base_url=mock_llm_server + "/v1",
                 api_key="mock-key",
                 model_name="mock-glm-model"
             )
     """
-    port = find_free_port(start=18000, end=18999)
-    proc = multiprocessing.Process(target=_run_llm_server, args=(port,), daemon=True)
-    proc.start()
+    return mock_servers.llm_url
 
-    url = f"http://127.0.0.1:{port}"
-    wait_for_server(url, timeout=5.0, endpoint="/test/stats")
 
-    yield url
-
-    proc.terminate()
-    proc.join(timeout=2)
-    if proc.is_alive():
-        proc.kill()
-        proc.join(timeout=1)
-
-
-@pytest.fixture
-def mock_agent_server(request):
-    """Start mock agent server on a free port (function-scoped).
+@pytest.fixture(scope="session")
+def mock_agent_server(mock_servers: MockServers) -> str:
+    """Base URL of the shared mock agent server (session-scoped).
 
     Returns:
         Base URL of the mock agent server (e.g., "http://127.0.0.1:19123")
 
     Example:
-        def test_something(mock_agent_server: str):
+        def test_something(mock_agent_server: str, test_client):
             device = RemoteDevice("mock_001", mock_agent_server)
             device.tap(100, 200)
 
-        # With scenario pre-loaded:
-        @pytest.mark.parametrize("mock_agent_server", ["path/to/scenario.yaml"], indirect=True)
-        def test_with_scenario(mock_agent_server: str):
-            # Scenario is already loaded
-            pass
+        # With a scenario loaded (reset by test_client before the next test):
+        def test_with_scenario(mock_agent_server: str, test_client, sample_test_case):
+            test_client.load_scenario(str(sample_test_case))
     """
-    # Check if scenario_path was passed via parametrize
-    scenario_path = None
-    if hasattr(request, "param"):
-        scenario_path = request.param
-
-    port = find_free_port(start=19000, end=19999)
-    proc = multiprocessing.Process(
-        target=_run_agent_server, args=(port, scenario_path), daemon=True
-    )
-    proc.start()
+    return mock_servers.agent_url
 
-    url = f"http://127.0.0.1:{port}"
-    wait_for_server(url, timeout=5.0, endpoint="/test/commands")
 
-    yield url
-
-    proc.terminate()
-    proc.join(timeout=2)
-    if proc.is_alive():
-        proc.kill()
-        proc.join(timeout=1)
+@pytest.fixture(scope="session")
+def http_client():
+    """Keep-alive HTTP client shared by the mock test clients and devices."""
+    with httpx.Client(timeout=30.0) as client:
+        yield client
 
 
 @pytest.fixture
-def mock_llm_client(mock_llm_server: str):
+def mock_llm_client(mock_llm_server: str, http_client: httpx.Client):
     """Create mock LLM client and reset state.
 
     Returns:
@@ -175,13 +261,13 @@ def mock_llm_client(mock_llm_server: str):
     """
     from tests.integration.device_agent.mock_llm_client import MockLLMTestClient
 
-    client = MockLLMTestClient(mock_llm_server)
+    client = MockLLMTestClient(mock_llm_server, client=http_client)
     client.reset()
     return client
 
 
 @pytest.fixture
-def test_client(mock_agent_server: str):
+def test_client(mock_agent_server: str, http_client: httpx.Client):
     """Create mock agent test client and reset state.
 
     Returns:
@@ -199,6 +285,58 @@ def test_client(mock_agent_server: str):
     """
     from tests.integration.device_agent.test_client import MockAgentTestClient
 
-    client = MockAgentTestClient(mock_agent_server)
+    client = MockAgentTestClient(mock_agent_server, client=http_client)
+    client.reset()
+    return client
+
+
+# 进程内 ASGI 客户端使用的虚拟地址，请求不会经过真实 socket
+_ASGI_AGENT_URL = "http://mock-agent"
+
+
+@pytest.fixture(scope="session")
+def asgi_agent():
+    """In-process client for a mock agent app (session-scoped).
+
+    Starlette's TestClient is an ``httpx.Client`` that dispatches requests
+    straight into the ASGI app, so no server process or loopback socket is
+    involved. The app shares the test process's ``MockAgentState``.
+    """
+    from starlette.testclient import TestClient
+
+    from tests.integration.device_agent.mock_agent_server import create_app
+
+    with TestClient(create_app(), base_url=_ASGI_AGENT_URL) as client:
+        yield client
+
+
+@pytest.fixture
+def asgi_test_client(asgi_agent):
+    """MockAgentTestClient on the in-process mock agent, with state reset.
+
+    Pair it with ``device``; use ``test_client`` for devices that talk to
+    the ``mock_agent_server`` subprocess.
+    """
+    from tests.integration.device_agent.test_client import MockAgentTestClient
+
+    client = MockAgentTestClient(_ASGI_AGENT_URL, client=asgi_agent)
     client.reset()
     return client
+
+
+@pytest.fixture(scope="session")
+def device(asgi_agent):
+    """RemoteDevice bound to the in-process mock agent ("mock_001").
+
+    The device itself is stateless, so one instance serves the whole
+    session; request ``asgi_test_client`` alongside it to start each test
+    from a reset mock agent.
+
+    Example:
+        def test_tap(device, asgi_test_client):
+            device.tap(100, 200)
+            asgi_test_client.assert_actions(["tap"])
+    """
+    from AutoGLM_GUI.devices.remote_device import RemoteDevice
+
+    return RemoteDevice("mock_001", _ASGI_AGENT_URL, client=asgi_agent)
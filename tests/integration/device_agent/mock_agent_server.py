@@ -60,8 +60,10 @@ class MockAgentState:
         )
 
     def reset(self):
-        """Reset command history."""
+        """Reset command history and unload any scenario."""
         self.commands = []
+        self.state_machine = None
+        self.scenario_path = None
 
     def load_scenario(self, path: str | Path):
         """Load a test scenario (state machine)."""
@@ -281,7 +283,7 @@ def _register_routes(app: FastAPI):
 
     @app.post("/test/reset")
     async def reset():
-        """Reset command history."""
+        """Reset command history and unload any scenario."""
         state.reset()
         return {"status": "reset", "commands_cleared": True}
 
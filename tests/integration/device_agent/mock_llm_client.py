@@ -5,6 +5,7 @@ in integration tests.
 """
 
 import httpx
+import orjson
 
 
 class MockLLMTestClient:
@@ -17,15 +18,27 @@ class MockLLMTestClient:
         >>> print(stats["request_count"])
     """
 
-    def __init__(self, base_url: str = "http://localhost:18003", timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:18003",
+        timeout: float = 30.0,
+        client: httpx.Client | None = None,
+    ):
         """Initialize the test client.
 
         Args:
             base_url: Base URL of the mock LLM server
-            timeout: HTTP request timeout
+            timeout: HTTP request timeout (ignored when ``client`` is given)
+            client: Shared HTTP client to reuse; the caller closes it
         """
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.Client(timeout=timeout)
+
+    def _request(self, method: str, path: str, **kwargs) -> dict:
+        resp = self._client.request(method, f"{self.base_url}{path}", **kwargs)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
     def get_stats(self) -> dict:
         """Get request statistics.
@@ -33,19 +46,15 @@ class MockLLMTestClient:
         Returns:
             Dict with 'request_count' and 'total_responses'
         """
-        resp = self._client.get("/test/stats")
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("GET", "/test/stats")
 
     def reset(self) -> dict:
-        """Reset request counter.
+        """Reset request counter and restore the default responses.
 
         Returns:
             Dict with reset status
         """
-        resp = self._client.post("/test/reset")
-        resp.raise_for_status()
-        return resp.json()
+        return self._request("POST", "/test/reset")
 
     def set_responses(self, responses: list[str]) -> dict:
         """Set custom responses.
@@ -56,9 +65,12 @@ class MockLLMTestClient:
         Returns:
             Dict with update status and response count
         """
-        resp = self._client.post("/test/set_responses", json=responses)
-        resp.raise_for_status()
-        return resp.json()
+        return self._request(
+            "POST",
+            "/test/set_responses",
+            content=orjson.dumps(responses),
+            headers={"Content-Type": "application/json"},
+        )
 
     def assert_request_count(self, expected: int) -> None:
         """Assert request count matches expected.
@@ -74,8 +86,9 @@ class MockLLMTestClient:
         assert actual == expected, f"Expected {expected} requests, got {actual}"
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client (unless it was injected)."""
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self):
         return self
@@ -5,15 +5,26 @@ returning predefined responses in a round-robin fashion via SSE streaming.
 """
 
 import asyncio
-import json
+import itertools
+import os
+import socket
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import AsyncGenerator, Iterator
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+
+
+# Words per streamed SSE chunk; clients only concatenate delta.content
+WORDS_PER_CHUNK = 16
+
+# Optional per-chunk delay in seconds (e.g. MOCK_LLM_DELAY=0.01) to simulate
+# network latency; off by default since no test depends on chunk timing
+ARTIFICIAL_DELAY = float(os.environ.get("MOCK_LLM_DELAY", "0"))
 
 
 # Predefined responses for the "点击消息按钮" task
@@ -50,81 +61,114 @@ finish(message="已成功点击消息按钮！现在进入了消息页面，可
 
 @dataclass
 class MockLLMState:
-    """Global state for the mock LLM server."""
+    """Global state for the mock LLM server.
+
+    All access goes through ``_lock`` so that a reset or a response swap from
+    the test helper endpoints never interleaves with a request picking its
+    response, even if those code paths start awaiting in the future.
+    """
 
     request_count: int = 0
     responses: list[str] = field(default_factory=lambda: DEFAULT_RESPONSES.copy())
+    _counter: Iterator[int] = field(default_factory=itertools.count, repr=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
-    def get_next_response(self) -> str:
+    async def get_next_response(self) -> str:
         """Get next response in round-robin fashion."""
-        if not self.responses:
-            return "No responses configured"
-
-        idx = self.request_count % len(self.responses)
-        self.request_count += 1
-        return self.responses[idx]
-
-    def reset(self) -> None:
-        """Reset request count."""
-        self.request_count = 0
-
-    def set_responses(self, responses: list[str]) -> None:
+        async with self._lock:
+            if not self.responses:
+                return "No responses configured"
+
+            n = next(self._counter)
+            self.request_count = n + 1
+            return self.responses[n % len(self.responses)]
+
+    async def reset(self) -> None:
+        """Reset request count and restore the default responses."""
+        async with self._lock:
+            self._counter = itertools.count()
+            self.request_count = 0
+            self.responses = DEFAULT_RESPONSES.copy()
+
+    async def set_responses(self, responses: list[str]) -> None:
         """Override predefined responses."""
-        self.responses = responses
-        self.request_count = 0
+        async with self._lock:
+            self.responses = responses
+            self._counter = itertools.count()
+            self.request_count = 0
+            _encode_frames.cache_clear()
 
 
 # Global state instance
 state = MockLLMState()
 
 
-class ChatRequest(BaseModel):
-    """OpenAI-compatible chat request."""
+# SSE framing, assembled as bytes around orjson output (no str round-trip)
+_SSE_DATA_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = _SSE_DATA_PREFIX + b"[DONE]" + _SSE_SUFFIX
 
-    model: str
-    messages: list[dict]
-    stream: bool = True
-    # Other OpenAI params (ignored for mock)
 
+@lru_cache(maxsize=None)
+def _encode_frames(content: str) -> tuple[bytes, ...]:
+    """Encode the per-content tail of every OpenAI-compatible chunk.
 
-async def stream_response(content: str) -> AsyncGenerator[str, None]:
+    Canned responses repeat across requests, so each distinct content is
+    encoded once; the cache is cleared when responses are replaced. Each
+    tail is a chunk's JSON without its opening ``{"id":...,"created":...,``
+    head, which stream_response() splices in per completion.
+    """
+    words = content.split()
+    chunks = []
+    for i in range(0, len(words), WORDS_PER_CHUNK):
+        text = "".join(word + " " for word in words[i : i + WORDS_PER_CHUNK])
+        chunks.append(
+            {
+                "model": "mock-glm-model",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": text},
+                        "finish_reason": None,
+                    }
+                ],
+            }
+        )
+
+    # Final chunk with finish_reason
+    chunks.append(
+        {
+            "model": "mock-glm-model",
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        }
+    )
+    # 去掉开头的 "{"，由每次请求的 head 补上
+    return tuple(orjson.dumps(chunk)[1:] + _SSE_SUFFIX for chunk in chunks)
+
+
+async def stream_response(content: str) -> AsyncGenerator[bytes, None]:
     """Stream content as OpenAI-compatible SSE chunks.
 
+    Every completion gets its own id and created timestamp, shared by all of
+    its chunks (as OpenAI does); only the cached tails are reused.
+
     Args:
         content: The full response text to stream
 
     Yields:
         SSE-formatted chunks (data: JSON\\n\\n)
     """
-    words = content.split()
-
-    for i, word in enumerate(words):
-        chunk = {
-            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": "mock-glm-model",
-            "choices": [
-                {
-                    "index": 0,
-                    "delta": {"content": word + " "},
-                    "finish_reason": None,
-                }
-            ],
-        }
-        yield f"data: {json.dumps(chunk)}\n\n"
-        await asyncio.sleep(0.01)  # Simulate network delay
-
-    # Final chunk with finish_reason
-    final_chunk = {
-        "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
-        "object": "chat.completion.chunk",
-        "created": int(time.time()),
-        "model": "mock-glm-model",
-        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
-    }
-    yield f"data: {json.dumps(final_chunk)}\n\n"
-    yield "data: [DONE]\n\n"
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    head = b'%s{"id":"%s","object":"chat.completion.chunk","created":%d,' % (
+        _SSE_DATA_PREFIX,
+        completion_id.encode(),
+        int(time.time()),
+    )
+    for tail in _encode_frames(content):
+        yield head + tail
+        if ARTIFICIAL_DELAY:
+            await asyncio.sleep(ARTIFICIAL_DELAY)
+    yield _SSE_DONE
 
 
 def create_app() -> FastAPI:
@@ -143,21 +187,31 @@ def _register_routes(app: FastAPI) -> None:
     """Register all routes on the app."""
 
     @app.post("/v1/chat/completions")
-    async def chat_completions(req: ChatRequest):
-        """OpenAI-compatible chat completions endpoint."""
+    async def chat_completions(request: Request):
+        """OpenAI-compatible chat completions endpoint.
+
+        The body is read as a plain dict: the mock only needs ``stream`` and
+        ``messages``, so a full request model would be wasted validation.
+        """
+        try:
+            body = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        if not isinstance(body, dict):
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
 
         # Validate streaming requirement
-        if not req.stream:
+        if not body.get("stream", True):
             raise HTTPException(
                 status_code=400, detail="Only streaming mode is supported"
             )
 
         # Validate messages array
-        if not req.messages:
+        if not body.get("messages"):
             raise HTTPException(status_code=400, detail="Messages array is required")
 
         # Get next response
-        response_text = state.get_next_response()
+        response_text = await state.get_next_response()
 
         # Stream response
         from fastapi.responses import StreamingResponse
@@ -178,14 +232,14 @@ def _register_routes(app: FastAPI) -> None:
 
     @app.post("/test/reset")
     async def reset():
-        """Reset request counter."""
-        state.reset()
+        """Reset request counter and responses."""
+        await state.reset()
         return {"status": "reset", "request_count": 0}
 
     @app.post("/test/set_responses")
     async def set_responses(responses: list[str]):
         """Set custom responses."""
-        state.set_responses(responses)
+        await state.set_responses(responses)
         return {"status": "updated", "response_count": len(responses)}
 
 
@@ -193,14 +247,34 @@ def _register_routes(app: FastAPI) -> None:
 app = create_app()
 
 
-def run_server(port: int = 18003, log_level: str = "warning"):
+def run_server(
+    port: int = 18003, log_level: str = "warning", sock: socket.socket | None = None
+):
     """Run the mock LLM server.
 
+    uvicorn[standard] is a project dependency, so the default ``loop="auto"`` /
+    ``http="auto"`` already serve on uvloop + httptools, falling back to
+    asyncio + h11 where those are unavailable (e.g. uvloop on Windows).
+
+    Access logging, lifespan handling and WebSocket support are switched off:
+    the app defines no lifespan hooks or WebSocket routes, and per-request log
+    formatting only slows the streaming tests down.
+
     Args:
         port: Port to listen on (default: 18003)
         log_level: Log level for uvicorn
+        sock: Pre-bound socket to serve on (overrides port)
     """
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level=log_level)
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level=log_level,
+        access_log=False,
+        lifespan="off",
+        ws="none",
+    )
+    uvicorn.Server(config).run(sockets=[sock] if sock is not None else None)
 
 
 if __name__ == "__main__":
@@ -23,35 +23,48 @@ class MockAgentTestClient:
         >>> assert commands[0]["action"] == "tap"
     """
 
-    def __init__(self, base_url: str = "http://localhost:8001", timeout: float = 30.0):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8001",
+        timeout: float = 30.0,
+        client: httpx.Client | None = None,
+    ):
+        """Initialize the test client.
+
+        Args:
+            base_url: Base URL of the mock agent server
+            timeout: HTTP request timeout (ignored when ``client`` is given)
+            client: Shared HTTP client to reuse; the caller closes it
+        """
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.Client(timeout=timeout)
 
     def reset(self) -> None:
-        """Reset command history."""
-        self._client.post("/test/reset")
+        """Reset command history and unload any scenario."""
+        self._client.post(f"{self.base_url}/test/reset")
 
     def load_scenario(self, scenario_path: str) -> dict:
         """Load a test scenario."""
         resp = self._client.post(
-            "/test/load_scenario", json={"scenario_path": scenario_path}
+            f"{self.base_url}/test/load_scenario", json={"scenario_path": scenario_path}
         )
         resp.raise_for_status()
         return resp.json()
 
     def get_commands(self) -> list[dict]:
         """Get all recorded commands."""
-        resp = self._client.get("/test/commands")
+        resp = self._client.get(f"{self.base_url}/test/commands")
         return resp.json()
 
     def get_actions(self) -> list[dict]:
         """Get simplified action list (action + params only)."""
-        resp = self._client.get("/test/commands/actions")
+        resp = self._client.get(f"{self.base_url}/test/commands/actions")
         return resp.json()
 
     def get_state(self) -> dict:
         """Get current state machine state."""
-        resp = self._client.get("/test/state")
+        resp = self._client.get(f"{self.base_url}/test/state")
         return resp.json()
 
     def expect(self, actions: list[str]) -> dict:
@@ -64,7 +77,9 @@ class MockAgentTestClient:
         Returns:
             Match result with details.
         """
-        resp = self._client.get("/test/expect", params={"actions": ",".join(actions)})
+        resp = self._client.get(
+            f"{self.base_url}/test/expect", params={"actions": ",".join(actions)}
+        )
         return resp.json()
 
     def assert_actions(self, expected: list[str]) -> None:
@@ -122,8 +137,9 @@ class MockAgentTestClient:
         )
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client (unless it was injected)."""
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self):
         return self
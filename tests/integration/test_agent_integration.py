@@ -9,6 +9,7 @@ from tests.integration.test_runner import TestRunner
 class TestAgentIntegration:
     """Test Agent integration using state machine."""
 
+    @pytest.mark.usefixtures("mock_llm_client")
     def test_sample_case(self, sample_test_case: Path, mock_llm_server: str):
         """Test the sample test case (美团外卖消息按钮)."""
         from AutoGLM_GUI.config import ModelConfig
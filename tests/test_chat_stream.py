@@ -0,0 +1,169 @@
+"""Tests for the /api/chat/stream SSE endpoint."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from AutoGLM_GUI.api import agents
+from AutoGLM_GUI.exceptions import DeviceBusyError
+from AutoGLM_GUI.schemas import ChatRequest
+
+
+class _StubManager:
+    """Manager stand-in that records device holders."""
+
+    def __init__(self, acquire_delay=0.0, busy=False):
+        self.acquire_delay = acquire_delay
+        self.busy = busy
+        self.holders = 0
+        self.released = threading.Event()
+
+    def acquire_device(self, device_id, **kwargs):
+        time.sleep(self.acquire_delay)
+        if self.busy:
+            raise DeviceBusyError(f"Device {device_id} is busy")
+        self.holders += 1
+        return True
+
+    def release_device(self, device_id):
+        self.holders -= 1
+        self.released.set()
+
+    def get_agent(self, device_id):
+        return object()
+
+    def register_abort_handler(self, device_id, handler):
+        pass
+
+    def unregister_abort_handler(self, device_id):
+        pass
+
+
+def test_disconnect_during_acquire_releases_device(monkeypatch):
+    """A client gone while the acquire is pending must not leak the device."""
+    manager = _StubManager(acquire_delay=0.3)
+    monkeypatch.setattr(agents, "_manager", lambda: manager)
+
+    async def disconnect_early():
+        response = await agents.chat_stream(
+            ChatRequest(message="hi", device_id="device_001")
+        )
+        body = response.body_iterator
+        task = asyncio.ensure_future(body.__anext__())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await body.aclose()
+        # 等待线程中的获取完成并触发释放
+        await asyncio.to_thread(manager.released.wait, 5)
+
+    asyncio.run(disconnect_early())
+
+    assert manager.released.is_set()
+    assert manager.holders == 0
+
+
+_HEARTBEAT = {"type": "step", "data": {"step": -1}}
+
+
+class _FakeStreamer:
+    """AgentStepStreamer stand-in replaying a fixed event list."""
+
+    events: list = []
+
+    def __init__(self, agent, task):
+        self.closed = False
+
+    async def aiter(self):
+        for event in self.events:
+            await asyncio.sleep(0)
+            yield event
+
+    def abort(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def stream_client(monkeypatch):
+    """TestClient for the agents router with a stub manager and streamer."""
+    manager = _StubManager()
+    monkeypatch.setattr(agents, "_manager", lambda: manager)
+    monkeypatch.setattr(agents, "AgentStepStreamer", _FakeStreamer)
+    app = FastAPI()
+    app.include_router(agents.router)
+    return TestClient(app), manager
+
+
+def _post_stream(client):
+    return client.post(
+        "/api/chat/stream", json={"message": "hi", "device_id": "device_001"}
+    )
+
+
+def test_stream_frames(stream_client, monkeypatch):
+    """Events are sent as event/data frames carrying type and role."""
+    client, manager = stream_client
+    monkeypatch.setattr(
+        _FakeStreamer,
+        "events",
+        [
+            {"type": "thinking_chunk", "data": {"chunk": "想"}},
+            {"type": "done", "data": {"message": "ok", "steps": 1, "success": True}},
+        ],
+    )
+
+    response = _post_stream(client)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["x-accel-buffering"] == "no"
+    assert (
+        response.content
+        == (
+            'event: thinking_chunk\ndata: {"type":"thinking_chunk","role":"assistant",'
+            '"chunk":"想"}\n\n'
+            'event: done\ndata: {"type":"done","role":"assistant","message":"ok",'
+            '"steps":1,"success":true}\n\n'
+        ).encode()
+    )
+    assert manager.holders == 0
+
+
+def test_stream_busy_device_sends_error_frame(stream_client):
+    """DeviceBusyError turns into a single error frame."""
+    client, manager = stream_client
+    manager.busy = True
+
+    response = _post_stream(client)
+
+    assert response.content == (
+        b'event: error\ndata: {"type":"error","role":"assistant",'
+        b'"message":"Device is busy"}\n\n'
+    )
+
+
+def test_stream_idle_heartbeat_sends_ping(stream_client, monkeypatch):
+    """Idle heartbeats become ': ping' comments once the interval elapses."""
+    client, _ = stream_client
+    monkeypatch.setattr(agents, "_SSE_KEEPALIVE_INTERVAL", 0.0)
+    monkeypatch.setattr(_FakeStreamer, "events", [_HEARTBEAT])
+
+    assert _post_stream(client).content == b": ping\n\n"
+
+
+def test_stream_heartbeat_suppressed_within_interval(stream_client, monkeypatch):
+    """No ping is sent before the keep-alive interval has passed."""
+    client, _ = stream_client
+    monkeypatch.setattr(_FakeStreamer, "events", [_HEARTBEAT, _HEARTBEAT])
+
+    assert _post_stream(client).content == b""
@@ -0,0 +1,107 @@
+"""Tests for UnifiedConfigManager and the GET /api/config endpoint."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from AutoGLM_GUI.api import agents
+from AutoGLM_GUI.config_manager import UnifiedConfigManager
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    """Fresh (non-singleton) config manager reading from tmp_path."""
+    monkeypatch.setattr(UnifiedConfigManager, "_instance", None)
+    monkeypatch.setattr(UnifiedConfigManager, "_config_path", tmp_path / "config.json")
+    return UnifiedConfigManager()
+
+
+def test_load_file_config_parent_not_a_directory(manager, tmp_path):
+    """A config path under a regular file counts as a missing file."""
+    (tmp_path / "file").write_text("")
+    manager._config_path = tmp_path / "file" / "config.json"
+
+    assert manager.load_file_config() is False
+    assert manager.get_effective_config().base_url == ""
+
+
+def test_load_file_config_reloads_and_drops_file(manager):
+    """Loads the file, skips an unchanged one, and clears it once removed."""
+    manager._config_path.write_text(json.dumps({"base_url": "http://file/v1"}))
+
+    assert manager.load_file_config() is True
+    assert manager.load_file_config() is False
+    assert manager.get_effective_config().base_url == "http://file/v1"
+
+    manager._config_path.unlink()
+    assert manager.load_file_config() is False
+    assert manager.get_effective_config().base_url == ""
+
+
+def test_detect_conflicts_cached_per_effective_config(manager, monkeypatch):
+    """Conflicts are reused until a layer changes; callers get copies."""
+    monkeypatch.setenv("AUTOGLM_BASE_URL", "http://env/v1")
+    manager._config_path.write_text(json.dumps({"base_url": "http://file/v1"}))
+    manager.load_env_config()
+    manager.load_file_config()
+    manager.get_effective_config()
+
+    conflicts = manager.detect_conflicts()
+    assert [c.field for c in conflicts] == ["base_url"]
+
+    conflicts.clear()
+    assert [c.field for c in manager.detect_conflicts()] == ["base_url"]
+
+    manager._config_path.write_text(json.dumps({"base_url": "http://env/v1"}))
+    manager.load_file_config(force_reload=True)
+    manager.get_effective_config()
+    assert manager.detect_conflicts() == []
+
+
+@pytest.fixture
+def config_client(manager, monkeypatch):
+    """TestClient for the agents router, backed by the fresh manager."""
+    monkeypatch.setattr(agents, "config_manager", manager)
+    app = FastAPI()
+    app.include_router(agents.router)
+    return TestClient(app)
+
+
+def test_get_config_etag_roundtrip(manager, config_client):
+    """200 with ETag, 304 when it matches, 200 again after a config change."""
+    manager._config_path.write_text(json.dumps({"base_url": "http://a/v1"}))
+
+    first = config_client.get("/api/config")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = config_client.get("/api/config", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    manager._config_path.write_text(json.dumps({"base_url": "http://b/v1"}))
+    manager.load_file_config(force_reload=True)
+
+    changed = config_client.get("/api/config", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["base_url"] == "http://b/v1"
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ('"other"', False),
+        ("*", True),
+    ],
+)
+def test_etag_matches(header, matches):
+    assert agents._etag_matches(header, '"abc"') is matches
@@ -1,7 +1,5 @@
 """Tests for InternalMAIAgent implementation."""
 
-import base64
-from io import BytesIO
 from unittest.mock import Mock
 
 import pytest
@@ -10,20 +8,24 @@ from PIL import Image
 from AutoGLM_GUI.agents.mai.agent import InternalMAIAgent
 from AutoGLM_GUI.agents.mai.traj_memory import TrajMemory, TrajStep
 from AutoGLM_GUI.config import AgentConfig, ModelConfig
-from AutoGLM_GUI.parsers import MAIParser
+
+# 1x1 white PNG: the agent only needs a decodable image, while the reported
+# screen size comes from screenshot.width/height
+_SCREENSHOT_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4nGP4//8/AAX+Av4N70a4"
+    "AAAAAElFTkSuQmCC"
+)
+
+# Trajectory steps only hold the image as an opaque reference
+_BLANK_IMG = Image.new("RGB", (1, 1))
 
 
 @pytest.fixture
 def mock_device():
     device = Mock()
 
-    img = Image.new("RGB", (1080, 1920), color="white")
-    img_bytes = BytesIO()
-    img.save(img_bytes, format="PNG")
-    img_base64 = base64.b64encode(img_bytes.getvalue()).decode("utf-8")
-
     screenshot = Mock()
-    screenshot.base64_data = img_base64
+    screenshot.base64_data = _SCREENSHOT_BASE64
     screenshot.width = 1080
     screenshot.height = 1920
 
@@ -62,9 +64,8 @@ def test_traj_memory_initialization():
 def test_traj_memory_add_step():
     memory = TrajMemory(task_goal="test", task_id="123", steps=[])
 
-    img = Image.new("RGB", (100, 100))
     step = TrajStep(
-        screenshot=img,
+        screenshot=_BLANK_IMG,
         accessibility_tree=None,
         prediction="test prediction",
         action={"action": "click", "coordinate": [0.5, 0.5]},
@@ -81,24 +82,26 @@ def test_traj_memory_add_step():
     assert memory.steps[0].thought == "test thought"
 
 
+_HISTORY_STEPS = [
+    TrajStep(
+        screenshot=_BLANK_IMG,
+        accessibility_tree=None,
+        prediction=f"pred{i}",
+        action={"action": "click"},
+        conclusion="",
+        thought=f"thought{i}",
+        step_index=i,
+        agent_type="InternalMAIAgent",
+        model_name="test",
+        screenshot_bytes=f"bytes{i}".encode(),
+    )
+    for i in range(5)
+]
+
+
 def test_traj_memory_get_history():
     memory = TrajMemory(task_goal="test", task_id="123", steps=[])
-
-    for i in range(5):
-        img = Image.new("RGB", (100, 100))
-        step = TrajStep(
-            screenshot=img,
-            accessibility_tree=None,
-            prediction=f"pred{i}",
-            action={"action": "click"},
-            conclusion="",
-            thought=f"thought{i}",
-            step_index=i,
-            agent_type="InternalMAIAgent",
-            model_name="test",
-            screenshot_bytes=f"bytes{i}".encode(),
-        )
-        memory.add_step(step)
+    memory.steps.extend(_HISTORY_STEPS)
 
     images = memory.get_history_images(3)
     assert len(images) == 3
@@ -109,69 +112,58 @@ def test_traj_memory_get_history():
     assert thoughts[-1] == "thought4"
 
 
-def test_mai_parser_basic():
-    parser = MAIParser()
-
-    response = """<thinking>
+@pytest.mark.parametrize(
+    "response,expected_thinking,expected_coordinate",
+    [
+        pytest.param(
+            """<thinking>
 我需要点击按钮
 </thinking>
 <tool_call>
 {"name": "mobile_use", "arguments": {"action": "click", "coordinate": [500, 800]}}
-</tool_call>"""
-
-    result = parser.parse_with_thinking(response)
-
-    assert result["thinking"] == "我需要点击按钮"
-    assert "raw_action" in result
-    assert result["raw_action"]["action"] == "click"
-    assert len(result["raw_action"]["coordinate"]) == 2
-    assert 0 <= result["raw_action"]["coordinate"][0] <= 1
-    assert 0 <= result["raw_action"]["coordinate"][1] <= 1
-
-
-def test_mai_parser_thinking_model_compat():
-    parser = MAIParser()
-
-    response = """我需要点击按钮
+</tool_call>""",
+            "我需要点击按钮",
+            (500 / 999, 800 / 999),
+            id="basic",
+        ),
+        pytest.param(
+            """我需要点击按钮
 </think>
 <tool_call>
 {"name": "mobile_use", "arguments": {"action": "click", "coordinate": [500, 800]}}
-</tool_call>"""
-
-    result = parser.parse_with_thinking(response)
-
-    assert "thinking" in result
-    assert result["raw_action"]["action"] == "click"
-
-
-def test_mai_parser_coordinate_normalization():
-    parser = MAIParser()
-
-    response = """<thinking>test</thinking>
+</tool_call>""",
+            "我需要点击按钮",
+            (500 / 999, 800 / 999),
+            id="thinking_model_compat",
+        ),
+        pytest.param(
+            """<thinking>test</thinking>
 <tool_call>
 {"name": "mobile_use", "arguments": {"action": "click", "coordinate": [999, 999]}}
-</tool_call>"""
-
-    result = parser.parse_with_thinking(response)
-
-    x, y = result["raw_action"]["coordinate"]
-    assert abs(x - 1.0) < 0.01
-    assert abs(y - 1.0) < 0.01
-
-
-def test_mai_parser_bounding_box():
-    parser = MAIParser()
-
-    response = """<thinking>test</thinking>
+</tool_call>""",
+            "test",
+            (1.0, 1.0),
+            id="coordinate_normalization",
+        ),
+        pytest.param(
+            """<thinking>test</thinking>
 <tool_call>
 {"name": "mobile_use", "arguments": {"action": "click", "coordinate": [100, 200, 300, 400]}}
-</tool_call>"""
-
-    result = parser.parse_with_thinking(response)
-
-    x, y = result["raw_action"]["coordinate"]
-    assert abs(x - 200 / 999) < 0.01
-    assert abs(y - 300 / 999) < 0.01
+</tool_call>""",
+            "test",
+            (200 / 999, 300 / 999),
+            id="bounding_box",
+        ),
+    ],
+)
+def test_mai_parser(mai_parser, response, expected_thinking, expected_coordinate):
+    result = mai_parser.parse_with_thinking(response)
+
+    assert result["thinking"] == expected_thinking
+    assert result["raw_action"]["action"] == "click"
+    assert result["raw_action"]["coordinate"] == pytest.approx(
+        list(expected_coordinate), abs=0.01
+    )
 
 
 def test_internal_mai_agent_initialization(mock_device, model_config, agent_config):
@@ -199,7 +191,7 @@ def test_internal_mai_agent_reset(mock_device, model_config, agent_config):
     agent._is_running = True
     agent.traj_memory.add_step(
         TrajStep(
-            screenshot=Image.new("RGB", (100, 100)),
+            screenshot=_BLANK_IMG,
             accessibility_tree=None,
             prediction="test",
             action={},
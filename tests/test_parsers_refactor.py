@@ -1,61 +1,63 @@
 """Test the new parser architecture."""
 
-from AutoGLM_GUI.parsers import GLMParser, MAIParser, PhoneAgentParser
+import pytest
 
+from AutoGLM_GUI.parsers import GLMParser, PhoneAgentParser
 
-def test_glm_parser_tap():
-    parser = GLMParser()
-    result = parser.parse('do(action="Tap", coordinate=[500, 500])')
+
+@pytest.fixture(scope="module")
+def glm_parser():
+    return GLMParser()
+
+
+@pytest.fixture(scope="module")
+def phone_parser():
+    return PhoneAgentParser()
+
+
+def test_glm_parser_tap(glm_parser):
+    result = glm_parser.parse('do(action="Tap", coordinate=[500, 500])')
     assert result["_metadata"] == "do"
     assert result["action"] == "Tap"
     assert result["coordinate"] == [500, 500]
 
 
-def test_glm_parser_finish():
-    parser = GLMParser()
-    result = parser.parse('finish(message="Done")')
+def test_glm_parser_finish(glm_parser):
+    result = glm_parser.parse('finish(message="Done")')
     assert result["_metadata"] == "finish"
     assert result["message"] == "Done"
 
 
-def test_phone_parser_tap():
-    parser = PhoneAgentParser()
-    result = parser.parse('do(action="Tap", element=[500, 500])')
+def test_phone_parser_tap(phone_parser):
+    result = phone_parser.parse('do(action="Tap", element=[500, 500])')
     assert result["_metadata"] == "do"
     assert result["action"] == "Tap"
     assert result["element"] == [500, 500]
 
 
-def test_phone_parser_type():
-    parser = PhoneAgentParser()
-    result = parser.parse('do(action="Type", text="Hello")')
+def test_phone_parser_type(phone_parser):
+    result = phone_parser.parse('do(action="Type", text="Hello")')
     assert result["_metadata"] == "do"
     assert result["action"] == "Type"
     assert result["text"] == "Hello"
 
 
-def test_mai_parser_click():
-    parser = MAIParser()
+def test_mai_parser_click(mai_parser):
     raw = '<thinking>Click button</thinking><tool_call>{"name": "mobile_use", "arguments": {"action": "click", "coordinate": [0.5, 0.5]}}</tool_call>'
-    result = parser.parse(raw)
+    result = mai_parser.parse(raw)
     assert result["_metadata"] == "do"
     assert result["action"] == "Tap"
     assert result["element"] == [500, 500]
 
 
-def test_mai_parser_terminate():
-    parser = MAIParser()
+def test_mai_parser_terminate(mai_parser):
     raw = '<thinking>Task done</thinking><tool_call>{"name": "mobile_use", "arguments": {"action": "terminate", "status": "success"}}</tool_call>'
-    result = parser.parse(raw)
+    result = mai_parser.parse(raw)
     assert result["_metadata"] == "finish"
     assert result["message"] == "Task completed"
 
 
-def test_parser_coordinate_scales():
-    glm_parser = GLMParser()
-    phone_parser = PhoneAgentParser()
-    mai_parser = MAIParser()
-
+def test_parser_coordinate_scales(glm_parser, phone_parser, mai_parser):
     assert glm_parser.coordinate_scale == 1000
     assert phone_parser.coordinate_scale == 1000
     assert mai_parser.coordinate_scale == 999
@@ -0,0 +1,94 @@
+"""Tests for PhoneAgentManager initialization and per-device gating."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+import AutoGLM_GUI.agents
+from AutoGLM_GUI.config import AgentConfig, ModelConfig
+from AutoGLM_GUI.device_manager import DeviceManager
+from AutoGLM_GUI.exceptions import DeviceBusyError
+from AutoGLM_GUI.phone_agent_manager import AgentState, PhoneAgentManager
+
+DEVICE_ID = "device_001"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Fresh (non-singleton) manager with the device and agent factory stubbed."""
+    monkeypatch.setattr(DeviceManager, "get_instance", classmethod(lambda cls: Mock()))
+    monkeypatch.setattr(
+        AutoGLM_GUI.agents, "create_agent", lambda **kwargs: Mock(name="agent")
+    )
+    return PhoneAgentManager()
+
+
+def _init(manager, force=False):
+    return manager.initialize_agent_with_factory(
+        device_id=DEVICE_ID,
+        agent_type="glm",
+        model_config=ModelConfig(base_url="http://localhost:8000/v1"),
+        agent_config=AgentConfig(device_id=DEVICE_ID),
+        agent_specific_config={},
+        force=force,
+    )
+
+
+def test_initialize_agent(manager):
+    """Initialization stores the agent and leaves the device idle."""
+    agent = _init(manager)
+
+    assert manager.is_initialized(DEVICE_ID)
+    assert manager.get_agent(DEVICE_ID) is agent
+    assert manager._metadata[DEVICE_ID].state == AgentState.IDLE
+
+
+def test_acquire_release_updates_state(manager):
+    """Acquire marks the device busy, release returns it to idle."""
+    _init(manager)
+
+    assert manager.acquire_device(DEVICE_ID, timeout=0)
+    assert manager._metadata[DEVICE_ID].state == AgentState.BUSY
+
+    manager.release_device(DEVICE_ID)
+    assert manager._metadata[DEVICE_ID].state == AgentState.IDLE
+
+
+def test_busy_device_rejects_acquire_and_reinit(manager):
+    """A held device is busy for non-blocking acquire and forced re-init."""
+    _init(manager)
+    manager.acquire_device(DEVICE_ID)
+
+    with pytest.raises(DeviceBusyError):
+        manager.acquire_device(DEVICE_ID, timeout=0)
+    assert manager.acquire_device(DEVICE_ID, timeout=0, raise_on_timeout=False) is False
+    with pytest.raises(DeviceBusyError):
+        _init(manager, force=True)
+
+    manager.release_device(DEVICE_ID)
+    assert manager.acquire_device(DEVICE_ID, timeout=0)
+
+
+def test_release_wakes_blocked_acquirer(manager):
+    """A blocked acquirer gets the device once the holder releases it."""
+    _init(manager)
+    manager.acquire_device(DEVICE_ID)
+
+    acquired = threading.Event()
+
+    def waiter():
+        manager.acquire_device(DEVICE_ID, timeout=5)
+        acquired.set()
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    manager.release_device(DEVICE_ID)
+    assert acquired.wait(5)
+    thread.join()
+    assert manager._metadata[DEVICE_ID].state == AgentState.BUSY
+
+    manager.release_device(DEVICE_ID)
+    assert manager._metadata[DEVICE_ID].state == AgentState.IDLE
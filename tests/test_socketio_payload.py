@@ -0,0 +1,89 @@
+"""Tests for the Socket.IO video packet wire format."""
+
+import asyncio
+from types import SimpleNamespace
+
+import socketio
+
+from AutoGLM_GUI import socketio_server
+from AutoGLM_GUI.scrcpy_protocol import ScrcpyMediaStreamPacket
+from AutoGLM_GUI.socketio_server import _packet_to_payload
+
+
+def test_video_packet_bytes_sent_as_binary_attachment():
+    """Raw frame bytes travel as an attachment, not base64 inside the JSON."""
+    frame = bytes(range(256)) * 4
+    packet = ScrcpyMediaStreamPacket(type="data", data=frame, keyframe=True, pts=42)
+    payload = _packet_to_payload(packet)
+
+    encoded = socketio.packet.Packet(
+        socketio.packet.EVENT, data=["video-data", payload]
+    ).encode()
+
+    assert isinstance(encoded, list)
+    header, attachment = encoded
+    assert attachment == frame
+    assert '"_placeholder":true' in header
+    assert len(header) < 200
+
+    decoded = socketio.packet.Packet(encoded_packet=header)
+    assert decoded.add_attachment(attachment)
+    assert decoded.data == ["video-data", payload]
+
+
+class _SlowClientStreamer:
+    """Scrcpy stand-in whose client drains one engine.io packet per frame read."""
+
+    def __init__(self, packets, eio_queue):
+        self._packets = packets
+        self._eio_queue = eio_queue
+        self.max_backlog = 0
+
+    async def iter_packets(self):
+        for packet in self._packets:
+            self.max_backlog = max(self.max_backlog, self._eio_queue.qsize())
+            if not self._eio_queue.empty():
+                self._eio_queue.get_nowait()
+            await asyncio.sleep(0)
+            yield packet
+
+
+def test_slow_client_drops_frames_until_keyframe(monkeypatch):
+    """A growing engine.io backlog sheds frames and resumes at a keyframe."""
+    config = ScrcpyMediaStreamPacket(type="configuration", data=b"sps")
+    frames = [
+        ScrcpyMediaStreamPacket(
+            type="data", data=bytes([i % 256]), keyframe=(i % 40 == 0), pts=i
+        )
+        for i in range(300)
+    ]
+    eio_queue = asyncio.Queue()
+    emitted = []
+
+    async def emit(event, payload, to=None):
+        # 与 engine.io 一致：带二进制附件的事件入队两个包，且从不等待客户端
+        emitted.append(payload)
+        eio_queue.put_nowait("header")
+        eio_queue.put_nowait("attachment")
+
+    async def noop_stop(sid):
+        return None
+
+    sio = socketio_server.sio
+    monkeypatch.setattr(sio, "emit", emit)
+    monkeypatch.setattr(sio.manager, "eio_sid_from_sid", lambda sid, ns: "eio")
+    monkeypatch.setattr(sio.eio, "sockets", {"eio": SimpleNamespace(queue=eio_queue)})
+    monkeypatch.setattr(socketio_server, "_stop_stream_for_sid", noop_stop)
+
+    streamer = _SlowClientStreamer([config, *frames], eio_queue)
+    asyncio.run(socketio_server._stream_packets("sid", streamer))
+
+    assert streamer.max_backlog <= socketio_server._VIDEO_BACKLOG_LIMIT + 2
+    assert emitted[0]["type"] == "configuration"
+    pts = [p["pts"] for p in emitted[1:]]
+    assert len(pts) < len(frames)
+    assert pts[0] == 0
+    # 每次丢帧后都从关键帧恢复：任何跳跃后的第一帧必须是关键帧
+    for prev, cur in zip(pts, pts[1:]):
+        if cur != prev + 1:
+            assert cur % 40 == 0
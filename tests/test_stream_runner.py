@@ -0,0 +1,124 @@
+"""Tests for AgentStepStreamer event delivery and thinking coalescing."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from AutoGLM_GUI.agents.events import AgentEventType
+from AutoGLM_GUI.agents.stream_runner import (
+    MAX_COALESCED_THINKING_CHARS,
+    AgentStepStreamer,
+)
+
+THINKING = AgentEventType.THINKING.value
+STEP = AgentEventType.STEP.value
+DONE = AgentEventType.DONE.value
+
+
+def _queued_streamer(items, worker_alive=False):
+    """Streamer with a pre-filled queue and a stand-in worker thread."""
+    streamer = AgentStepStreamer(agent=Mock(), task="task")
+    streamer._worker_thread = Mock(is_alive=Mock(return_value=worker_alive))
+    for item in items:
+        streamer._event_queue.put(item)
+    return streamer
+
+
+def _thinking(chunk):
+    return (THINKING, {"chunk": chunk})
+
+
+def _drain(streamer):
+    events = []
+    while (event := streamer._next_or_none()) is not None:
+        events.append(event)
+    return events
+
+
+def test_thinking_merges_up_to_limit():
+    """Queued chunks merge until the limit, the rest starts a new event."""
+    half = MAX_COALESCED_THINKING_CHARS // 2
+    streamer = _queued_streamer(
+        [_thinking("a" * half), _thinking("b" * half), _thinking("c"), None]
+    )
+
+    events = _drain(streamer)
+
+    assert [e["data"]["chunk"] for e in events] == ["a" * half + "b" * half, "c"]
+
+
+def test_interrupting_events_delivered_in_order():
+    """A step or done event that stops a merge comes next, then the end."""
+    step = (STEP, {"step": 1, "finished": False})
+    done = (DONE, {"message": "ok", "steps": 1, "success": True})
+    streamer = _queued_streamer(
+        [_thinking("x"), _thinking("y"), step, _thinking("z"), done, None]
+    )
+
+    events = _drain(streamer)
+
+    assert [(e["type"], e["data"]) for e in events] == [
+        (THINKING, {"chunk": "xy"}),
+        step,
+        (THINKING, {"chunk": "z"}),
+        done,
+    ]
+
+
+def test_end_marker_interrupting_merge_stops_iteration():
+    """The None end marker picked up while merging still ends the stream."""
+    streamer = _queued_streamer([_thinking("x"), _thinking("y"), None])
+
+    assert streamer._next_or_none()["data"] == {"chunk": "xy"}
+    assert streamer._next_or_none() is None
+
+
+def test_idle_heartbeat_passes_through():
+    """An empty queue with a live worker yields the step -1 heartbeat."""
+    streamer = _queued_streamer([], worker_alive=True)
+
+    event = streamer._next_or_none()
+
+    assert event["type"] == STEP
+    assert event["data"]["step"] == -1
+
+
+class _FakeAgent:
+    """Agent that streams thinking chunks and finishes after one step."""
+
+    agent_config = SimpleNamespace(max_steps=5)
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._thinking_callback = None
+        self.step_count = 0
+
+    def step(self, task):
+        for chunk in self._chunks:
+            self._thinking_callback(chunk)
+        self.step_count += 1
+        return SimpleNamespace(
+            thinking="".join(self._chunks),
+            action=None,
+            success=True,
+            finished=True,
+            message="done",
+        )
+
+
+def test_aiter_with_fake_agent():
+    """Coalesced thinking reassembles in full and precedes step and done."""
+    chunks = [f"chunk{i} " for i in range(50)]
+    streamer = AgentStepStreamer(agent=_FakeAgent(chunks), task="task")
+
+    async def collect():
+        return [event async for event in streamer.aiter()]
+
+    with streamer.stream_context():
+        events = asyncio.run(collect())
+    # 忽略线程调度较慢时可能插入的空闲心跳
+    events = [e for e in events if e["data"].get("step") != -1]
+
+    thinking = [e for e in events if e["type"] == THINKING]
+    assert "".join(e["data"]["chunk"] for e in thinking) == "".join(chunks)
+    assert [e["type"] for e in events[len(thinking) :]] == [STEP, DONE]